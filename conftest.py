@@ -15,6 +15,12 @@ def unlock():
     mod().unlock()
 
 
+@pytest.fixture(scope="function", autouse=True)
+def preserve_dependencies():
+    with mod().preserve_dependencies():
+        yield
+
+
 @pytest.fixture(scope="function")
 def module() -> Module | CoreModule:
     return CoreModule()
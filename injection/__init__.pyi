@@ -261,6 +261,12 @@ class Module:
         Function to unlock the module by deleting cached instances of singletons.
         """
 
+    def preserve_dependencies(self) -> ContextManager[None]:
+        """
+        Context manager that restores the module's registrations on exit. Useful in
+        tests to undo injectables registered within the block.
+        """
+
     async def all_ready(self) -> None: ...
     def add_logger(self, logger: Logger) -> Self: ...
     @classmethod
@@ -282,6 +288,8 @@ class Priority(Enum):
 
 @runtime_checkable
 class Injectable[T](Protocol):
+    @property
+    def is_async(self) -> bool: ...
     @property
     def is_locked(self) -> bool: ...
     def unlock(self) -> None: ...
@@ -1,7 +1,7 @@
 from collections.abc import Iterable
 from typing import Any
 
-from injection._core.common.type import InputType, standardize_types
+from injection._core.common.type import InputType, standardized_types
 from injection._core.hook import HookGenerator
 from injection._core.module import Locator, Mode, Record, Updater
 
@@ -43,11 +43,11 @@ def standardize_input_classes[T](
     **__: Any,
 ) -> HookGenerator[Iterable[InputType[T]]]:
     classes = yield
-    return tuple(standardize_types(*classes, with_origin=True))
+    return standardized_types(*classes, with_origin=True)
 
 
 @Locator.static_hooks.on_update
 def standardize_classes[T](*_: Any, **__: Any) -> HookGenerator[Updater[T]]:
     updater = yield
-    updater.classes = frozenset(standardize_types(*updater.classes))
+    updater.classes = frozenset(standardized_types(*updater.classes))
     return updater
@@ -17,6 +17,11 @@ class SimpleAwaitable[T](Awaitable[T]):
 class Caller[**P, T](Protocol):
     __slots__ = ()
 
+    @property
+    @abstractmethod
+    def is_async(self) -> bool:
+        raise NotImplementedError
+
     @abstractmethod
     async def acall(self, /, *args: P.args, **kwargs: P.kwargs) -> T:
         raise NotImplementedError
@@ -30,6 +35,10 @@ class Caller[**P, T](Protocol):
 class AsyncCaller[**P, T](Caller[P, T]):
     callable: Callable[P, Awaitable[T]]
 
+    @property
+    def is_async(self) -> bool:
+        return True
+
     async def acall(self, /, *args: P.args, **kwargs: P.kwargs) -> T:
         return await self.callable(*args, **kwargs)
 
@@ -49,6 +58,10 @@ class AsyncCaller[**P, T](Caller[P, T]):
 class SyncCaller[**P, T](Caller[P, T]):
     callable: Callable[P, T]
 
+    @property
+    def is_async(self) -> bool:
+        return False
+
     async def acall(self, /, *args: P.args, **kwargs: P.kwargs) -> T:
         return self.callable(*args, **kwargs)
 
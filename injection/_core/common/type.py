@@ -1,9 +1,11 @@
 from collections.abc import Callable, Iterable, Iterator
+from functools import lru_cache
 from inspect import isfunction
 from types import GenericAlias, UnionType
 from typing import (
     Annotated,
     Any,
+    ForwardRef,
     TypeAliasType,
     Union,
     get_args,
@@ -16,6 +18,15 @@ type InputType[T] = TypeDef[T] | UnionType
 type TypeInfo[T] = InputType[T] | Callable[..., T] | Iterable[TypeInfo[T]]
 
 
+def _get_return_hint(function: Callable[..., Any]) -> Any:
+    annotation = function.__annotations__.get("return")
+
+    if annotation is None or isinstance(annotation, str | ForwardRef):
+        return get_type_hints(function).get("return")
+
+    return annotation
+
+
 def get_return_types(*args: TypeInfo[Any]) -> Iterator[InputType[Any]]:
     for arg in args:
         if isinstance(arg, Iterable) and not (
@@ -23,7 +34,7 @@ def get_return_types(*args: TypeInfo[Any]) -> Iterator[InputType[Any]]:
         ):
             inner_args = arg
 
-        elif isfunction(arg) and (return_type := get_type_hints(arg).get("return")):
+        elif isfunction(arg) and (return_type := _get_return_hint(arg)):
             inner_args = (return_type,)
 
         else:
@@ -37,17 +48,23 @@ def standardize_types(
     *types: InputType[Any],
     with_origin: bool = False,
 ) -> Iterator[TypeDef[Any]]:
-    for tp in types:
+    origin_of = get_origin
+    args_of = get_args
+    stack = list(reversed(types))
+
+    while stack:
+        tp = stack.pop()
+
         if tp is None:
             continue
 
-        origin = get_origin(tp)
+        origin = origin_of(tp)
 
         if origin is Union or isinstance(tp, UnionType):
-            inner_types = get_args(tp)
+            stack.extend(reversed(args_of(tp)))
 
         elif origin is Annotated:
-            inner_types = get_args(tp)[:1]
+            stack.extend(args_of(tp)[:1])
 
         else:
             yield tp
@@ -55,6 +72,28 @@ def standardize_types(
             if with_origin and origin is not None:
                 yield origin
 
-            continue
 
-        yield from standardize_types(*inner_types, with_origin=with_origin)
+@lru_cache(maxsize=256)
+def _standardize_hashable_type(
+    tp: InputType[Any],
+    with_origin: bool,
+) -> tuple[TypeDef[Any], ...]:
+    return tuple(standardize_types(tp, with_origin=with_origin))
+
+
+def standardized_types(
+    *types: InputType[Any],
+    with_origin: bool = False,
+) -> tuple[TypeDef[Any], ...]:
+    standardized: list[TypeDef[Any]] = []
+
+    for tp in types:
+        try:
+            # Unhashable annotations fall back to the uncached walk below.
+            inner_types = _standardize_hashable_type(tp, with_origin)  # type: ignore[arg-type]
+        except TypeError:
+            inner_types = tuple(standardize_types(tp, with_origin=with_origin))
+
+        standardized.extend(inner_types)
+
+    return tuple(standardized)
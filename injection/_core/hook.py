@@ -1,5 +1,6 @@
 import itertools
 from collections.abc import Callable, Generator, Iterator
+from contextlib import suppress
 from dataclasses import dataclass, field
 from inspect import isclass, isgeneratorfunction
 from typing import Any, Self, TypeGuard
@@ -18,6 +19,11 @@ class Hook[**P, T]:
         init=False,
         repr=False,
     )
+    __composed: dict[int, tuple[int, Callable[P, T], Callable[P, T]]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
 
     def __call__(
         self,
@@ -38,6 +44,20 @@ class Hook[**P, T]:
         self.__functions.extend(reversed(functions))
         return self
 
+    def compose(self, handler: Callable[P, T]) -> Callable[P, T]:
+        key = id(handler)
+        version = len(self.__functions)
+
+        with suppress(KeyError):
+            cached_version, _, composed = self.__composed[key]
+
+            if cached_version == version:
+                return composed
+
+        composed = self.apply_several(handler, self)
+        self.__composed[key] = (version, handler, composed)
+        return composed
+
     @classmethod
     def apply_several(cls, handler: Callable[P, T], *hooks: Self) -> Callable[P, T]:
         stack = itertools.chain.from_iterable((hook.__stack for hook in hooks))
@@ -97,11 +117,3 @@ class Hook[**P, T]:
                 return True
 
         return False
-
-
-def apply_hooks[**P, T](
-    handler: Callable[P, T],
-    hook: Hook[P, T],
-    *hooks: Hook[P, T],
-) -> Callable[P, T]:
-    return Hook.apply_several(handler, hook, *hooks)
@@ -1,6 +1,5 @@
 from abc import ABC, abstractmethod
 from collections.abc import MutableMapping
-from contextlib import suppress
 from dataclasses import dataclass
 from typing import Any, ClassVar, NoReturn, Protocol, runtime_checkable
 
@@ -13,6 +12,10 @@ from injection.exceptions import InjectionError
 class Injectable[T](Protocol):
     __slots__ = ()
 
+    @property
+    def is_async(self) -> bool:
+        return False
+
     @property
     def is_locked(self) -> bool:
         return False
@@ -33,6 +36,10 @@ class Injectable[T](Protocol):
 class BaseInjectable[T](Injectable[T], ABC):
     factory: Caller[..., T]
 
+    @property
+    def is_async(self) -> bool:
+        return self.factory.is_async
+
 
 class SimpleInjectable[T](BaseInjectable[T]):
     __slots__ = ()
@@ -61,31 +68,31 @@ class SingletonInjectable[T](BaseInjectable[T]):
         self.cache.clear()
 
     async def aget_instance(self) -> T:
-        with suppress(KeyError):
-            return self.__check_instance()
+        cache = self.__dict__
+        key = self.__key
 
-        with synchronized():
-            instance = await self.factory.acall()
-            self.__set_instance(instance)
+        try:
+            instance: T = cache[key]
+        except KeyError:
+            with synchronized():
+                instance = await self.factory.acall()
+                cache[key] = instance
 
         return instance
 
     def get_instance(self) -> T:
-        with suppress(KeyError):
-            return self.__check_instance()
+        cache = self.__dict__
+        key = self.__key
 
-        with synchronized():
-            instance = self.factory.call()
-            self.__set_instance(instance)
+        try:
+            instance: T = cache[key]
+        except KeyError:
+            with synchronized():
+                instance = self.factory.call()
+                cache[key] = instance
 
         return instance
 
-    def __check_instance(self) -> T:
-        return self.cache[self.__key]
-
-    def __set_instance(self, value: T) -> None:
-        self.cache[self.__key] = value
-
 
 @dataclass(repr=False, frozen=True, slots=True)
 class ShouldBeInjectable[T](Injectable[T]):
@@ -1,22 +1,29 @@
 from __future__ import annotations
 
 import asyncio
+import sys
 from abc import ABC, abstractmethod
 from collections import OrderedDict
 from collections.abc import (
-    AsyncIterator,
     Awaitable,
     Callable,
     Collection,
     Iterable,
     Iterator,
     Mapping,
+    MutableMapping,
 )
 from contextlib import contextmanager, suppress
 from dataclasses import dataclass, field
 from enum import StrEnum
-from functools import partialmethod, singledispatchmethod, update_wrapper
-from inspect import Signature, isclass, iscoroutinefunction, markcoroutinefunction
+from functools import lru_cache, partialmethod, singledispatchmethod, update_wrapper
+from inspect import (
+    Parameter,
+    Signature,
+    isclass,
+    iscoroutinefunction,
+    markcoroutinefunction,
+)
 from inspect import signature as inspect_signature
 from logging import Logger, getLogger
 from queue import Empty, Queue
@@ -25,6 +32,7 @@ from typing import (
     Any,
     ClassVar,
     ContextManager,
+    Final,
     Literal,
     NamedTuple,
     Protocol,
@@ -33,6 +41,7 @@ from typing import (
     runtime_checkable,
 )
 from uuid import uuid4
+from weakref import WeakKeyDictionary, WeakSet
 
 from injection._core.common.asynchronous import (
     AsyncCaller,
@@ -45,7 +54,7 @@ from injection._core.common.invertible import Invertible, SimpleInvertible
 from injection._core.common.lazy import Lazy, LazyMapping
 from injection._core.common.threading import synchronized
 from injection._core.common.type import InputType, TypeInfo, get_return_types
-from injection._core.hook import Hook, apply_hooks
+from injection._core.hook import Hook
 from injection._core.injectables import (
     Injectable,
     ShouldBeInjectable,
@@ -208,6 +217,14 @@ class Updater[T]:
         return Record(injectable, self.mode)
 
 
+def _keep_existing_record(*args: Any, **kwargs: Any) -> bool:
+    return False
+
+
+def _identity[T](value: T) -> T:
+    return value
+
+
 @dataclass(repr=False, eq=False, frozen=True, slots=True)
 class LocatorHooks[T]:
     on_conflict: Hook[[Record[T], Record[T], InputType[T]], bool] = field(
@@ -226,6 +243,14 @@ class LocatorHooks[T]:
 
 @dataclass(repr=False, frozen=True, slots=True)
 class Locator(Broker):
+    __cache: MutableMapping[InputType[Any], Injectable[Any]] = field(
+        default_factory=WeakKeyDictionary,
+        init=False,
+    )
+    __misses: WeakSet[Any] = field(
+        default_factory=WeakSet,
+        init=False,
+    )
     __records: dict[InputType[Any], Record[Any]] = field(
         default_factory=dict,
         init=False,
@@ -238,17 +263,44 @@ class Locator(Broker):
     static_hooks: ClassVar[LocatorHooks[Any]] = LocatorHooks()
 
     def __getitem__[T](self, cls: InputType[T], /) -> Injectable[T]:
+        with suppress(KeyError, TypeError):
+            return self.__cache[cls]
+
+        with suppress(KeyError, TypeError):
+            record: Record[T] = self.__records[cls]
+            return record.injectable
+
+        with suppress(TypeError):
+            if cls in self.__misses:
+                raise NoInjectable(cls)
+
         for input_class in self.__standardize_inputs((cls,)):
             try:
                 record = self.__records[input_class]
             except KeyError:
                 continue
 
-            return record.injectable
+            injectable = record.injectable
+
+            with suppress(TypeError):
+                self.__cache[cls] = injectable
+
+            return injectable
+
+        with suppress(TypeError):
+            self.__misses.add(cls)
 
         raise NoInjectable(cls)
 
     def __contains__(self, cls: InputType[Any], /) -> bool:
+        with suppress(TypeError):
+            if cls in self.__records:
+                return True
+
+        with suppress(TypeError):
+            if cls in self.__misses:
+                return False
+
         return any(
             input_class in self.__records
             for input_class in self.__standardize_inputs((cls,))
@@ -273,6 +325,8 @@ class Locator(Broker):
 
             with self.dispatch(event):
                 self.__records.update(records)
+                self.__cache.clear()
+                self.__misses.clear()
 
         return self
 
@@ -283,6 +337,15 @@ class Locator(Broker):
 
         return self
 
+    @contextmanager
+    def preserve_dependencies(self) -> Iterator[None]:
+        records = dict(self.__records)
+        yield
+        self.__records.clear()
+        self.__records.update(records)
+        self.__cache.clear()
+        self.__misses.clear()
+
     async def all_ready(self) -> None:
         for injectable in self.__injectables:
             await injectable.aget_instance()
@@ -316,19 +379,20 @@ class Locator(Broker):
         existing: Record[T],
         cls: InputType[T],
     ) -> bool:
-        return apply_hooks(
-            lambda *args, **kwargs: False,
-            self.static_hooks.on_conflict,
-        )(new, existing, cls)
+        return self.static_hooks.on_conflict.compose(_keep_existing_record)(
+            new,
+            existing,
+            cls,
+        )
 
     def __standardize_inputs[T](
         self,
         classes: Iterable[InputType[T]],
     ) -> Iterable[InputType[T]]:
-        return apply_hooks(lambda c: c, self.static_hooks.on_input)(classes)
+        return self.static_hooks.on_input.compose(_identity)(classes)
 
     def __update_preprocessing[T](self, updater: Updater[T]) -> Updater[T]:
-        return apply_hooks(lambda u: u, self.static_hooks.on_update)(updater)
+        return self.static_hooks.on_update.compose(_identity)(updater)
 
 
 """
@@ -483,7 +547,15 @@ class Module(Broker, EventListener):
                 wp.__init__ = self.inject(wp.__init__)
                 return wp
 
-            return self.make_injected_function(wp)
+            try:
+                signature = inspect_signature(wp, eval_str=False)
+            except (TypeError, ValueError):
+                signature = None
+
+            if signature is not None and not signature.parameters:
+                return wp
+
+            return self.make_injected_function(wp, signature)
 
         return decorator(wrapped) if wrapped else decorator
 
@@ -492,6 +564,7 @@ class Module(Broker, EventListener):
         self,
         wrapped: Callable[P, T],
         /,
+        signature: Signature | None = ...,
     ) -> SyncInjectedFunction[P, T]: ...
 
     @overload
@@ -499,10 +572,11 @@ class Module(Broker, EventListener):
         self,
         wrapped: Callable[P, Awaitable[T]],
         /,
+        signature: Signature | None = ...,
     ) -> AsyncInjectedFunction[P, T]: ...
 
-    def make_injected_function(self, wrapped, /):  # type: ignore[no-untyped-def]
-        metadata = InjectMetadata(wrapped)
+    def make_injected_function(self, wrapped, /, signature=None):  # type: ignore[no-untyped-def]
+        metadata = InjectMetadata(wrapped, signature)
 
         @metadata.on_setup
         def listen() -> None:
@@ -689,6 +763,11 @@ class Module(Broker, EventListener):
 
         return self
 
+    @contextmanager
+    def preserve_dependencies(self) -> Iterator[None]:
+        with self.__locator.preserve_dependencies():
+            yield
+
     async def all_ready(self) -> None:
         for broker in self.__brokers:
             await broker.all_ready()
@@ -763,24 +842,68 @@ def mod(name: str | None = None, /) -> Module:
 InjectedFunction
 """
 
+_SIGNATURE_CACHE: Final[WeakKeyDictionary[Callable[..., Any], Signature]] = (
+    WeakKeyDictionary()
+)
 
-@dataclass(repr=False, frozen=True, slots=True)
+
+@lru_cache(maxsize=512)
+def _eval_cached_annotation(annotation: str, module_name: str) -> Any:
+    return eval(annotation, vars(sys.modules[module_name]))
+
+
+def _eval_string_annotation(annotation: str, function: Callable[..., Any]) -> Any:
+    globalns = function.__globals__
+    module_name = getattr(function, "__module__", None)
+    module = sys.modules.get(module_name) if module_name else None
+
+    if module is not None and globalns is getattr(module, "__dict__", None):
+        return _eval_cached_annotation(sys.intern(annotation), module_name)
+
+    return eval(annotation, globalns)
+
+
+def _resolve_signature(
+    function: Callable[..., Any],
+    raw_signature: Signature | None = None,
+) -> Signature:
+    if not hasattr(function, "__globals__"):
+        return inspect_signature(function, eval_str=True)
+
+    if raw_signature is None:
+        raw_signature = inspect_signature(function, eval_str=False)
+
+    parameters = []
+    resolved = False
+
+    for parameter in raw_signature.parameters.values():
+        annotation = parameter.annotation
+
+        if isinstance(annotation, str):
+            annotation = _eval_string_annotation(annotation, function)
+            parameter = parameter.replace(annotation=annotation)
+            resolved = True
+
+        parameters.append(parameter)
+
+    if resolved:
+        return raw_signature.replace(parameters=parameters)
+
+    return raw_signature
+
+
+@dataclass(repr=False, eq=False, slots=True)
 class Dependencies:
     mapping: Mapping[str, Injectable[Any]]
+    __has_async: bool | None = field(default=None, init=False)
+    __items: tuple[tuple[str, Injectable[Any]], ...] | None = field(
+        default=None,
+        init=False,
+    )
 
     def __bool__(self) -> bool:
         return bool(self.mapping)
 
-    def __iter__(self) -> Iterator[tuple[str, Any]]:
-        for name, injectable in self.mapping.items():
-            instance = injectable.get_instance()
-            yield name, instance
-
-    async def __aiter__(self) -> AsyncIterator[tuple[str, Any]]:
-        for name, injectable in self.mapping.items():
-            instance = await injectable.aget_instance()
-            yield name, instance
-
     @property
     def are_resolved(self) -> bool:
         if isinstance(self.mapping, LazyMapping) and not self.mapping.is_set:
@@ -788,11 +911,36 @@ class Dependencies:
 
         return bool(self)
 
+    @property
+    def has_async(self) -> bool:
+        has_async = self.__has_async
+
+        if has_async is None:
+            has_async = any(injectable.is_async for _, injectable in self.items)
+            self.__has_async = has_async
+
+        return has_async
+
+    @property
+    def items(self) -> tuple[tuple[str, Injectable[Any]], ...]:
+        items = self.__items
+
+        if items is None:
+            items = tuple(self.mapping.items())
+            self.__items = items
+
+        return items
+
     async def aget_arguments(self) -> dict[str, Any]:
-        return {key: value async for key, value in self}
+        if not self.has_async:
+            return self.get_arguments()
+
+        return {
+            name: await injectable.aget_instance() for name, injectable in self.items
+        }
 
     def get_arguments(self) -> dict[str, Any]:
-        return dict(self)
+        return {name: injectable.get_instance() for name, injectable in self.items}
 
     @classmethod
     def from_mapping(cls, mapping: Mapping[str, Injectable[Any]]) -> Self:
@@ -850,33 +998,86 @@ class Arguments(NamedTuple):
 class InjectMetadata[**P, T](Caller[P, T], EventListener):
     __slots__ = (
         "__dependencies",
+        "__dependency_plan",
         "__owner",
+        "__raw_signature",
         "__setup_queue",
         "__signature",
         "__wrapped",
     )
 
     __dependencies: Dependencies
+    __dependency_plan: tuple[tuple[str, ...], tuple[str, ...]] | None
     __owner: type | None
+    __raw_signature: Signature | None
     __setup_queue: Queue[Callable[..., Any]] | None
     __signature: Signature
     __wrapped: Callable[P, T]
 
-    def __init__(self, wrapped: Callable[P, T], /) -> None:
+    def __init__(
+        self,
+        wrapped: Callable[P, T],
+        /,
+        signature: Signature | None = None,
+    ) -> None:
         self.__dependencies = Dependencies.empty()
+        self.__dependency_plan = None
         self.__owner = None
+        self.__raw_signature = signature
         self.__setup_queue = Queue()
         self.__wrapped = wrapped
 
+    @property
+    def is_async(self) -> bool:
+        visited: set[int] = set()
+        stack: list[InjectMetadata[Any, Any]] = [self]
+
+        while stack:
+            metadata = stack.pop()
+            key = id(metadata)
+
+            if key in visited:
+                continue
+
+            visited.add(key)
+
+            if iscoroutinefunction(metadata.wrapped):
+                return True
+
+            if metadata.__setup_queue is not None:
+                # Dependencies aren't resolved yet, so assume the worst case.
+                return True
+
+            for _, injectable in metadata.__dependencies.items:
+                factory = getattr(injectable, "factory", None)
+
+                if isinstance(factory, InjectMetadata):
+                    stack.append(factory)
+                elif injectable.is_async:
+                    return True
+
+        return False
+
     @property
     def signature(self) -> Signature:
         with suppress(AttributeError):
             return self.__signature
 
+        wrapped = self.wrapped
+
+        with suppress(KeyError, TypeError):
+            signature = _SIGNATURE_CACHE[wrapped]
+            self.__signature = signature
+            return signature
+
         with synchronized():
-            signature = inspect_signature(self.wrapped, eval_str=True)
+            signature = _resolve_signature(wrapped, self.__raw_signature)
+            self.__raw_signature = None
             self.__signature = signature
 
+            with suppress(TypeError):
+                _SIGNATURE_CACHE[wrapped] = signature
+
         return signature
 
     @property
@@ -924,6 +1125,7 @@ class InjectMetadata[**P, T](Caller[P, T], EventListener):
     @synchronized()
     def update(self, module: Module) -> Self:
         self.__dependencies = Dependencies.resolve(self.signature, module, self.__owner)
+        self.__dependency_plan = None
         return self
 
     def on_setup[**_P, _T](self, wrapped: Callable[_P, _T] | None = None, /) -> Any:
@@ -960,10 +1162,43 @@ class InjectMetadata[**P, T](Caller[P, T], EventListener):
         if not additional_arguments:
             return Arguments(args, kwargs)
 
+        if not args and not kwargs:
+            return self.__bind_dependencies(additional_arguments)
+
         bound = self.signature.bind_partial(*args, **kwargs)
-        bound.arguments = bound.arguments | additional_arguments | bound.arguments
+        bound.arguments = additional_arguments | bound.arguments
         return Arguments(bound.args, bound.kwargs)
 
+    def __bind_dependencies(self, arguments: dict[str, Any]) -> Arguments:
+        plan = self.__dependency_plan
+
+        if plan is None:
+            plan = self.__make_dependency_plan(arguments)
+            self.__dependency_plan = plan
+
+        positional_names, keyword_names = plan
+        args = tuple(arguments[name] for name in positional_names)
+        kwargs = {name: arguments[name] for name in keyword_names}
+        return Arguments(args, kwargs)
+
+    def __make_dependency_plan(
+        self,
+        names: Collection[str],
+    ) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        positional: list[str] = []
+
+        for parameter in self.signature.parameters.values():
+            if parameter.kind is not Parameter.POSITIONAL_ONLY:
+                break
+
+            if parameter.name not in names:
+                break
+
+            positional.append(parameter.name)
+
+        keywords = tuple(name for name in names if name not in positional)
+        return tuple(positional), keywords
+
     def __close_setup_queue(self) -> None:
         self.__setup_queue = None
 
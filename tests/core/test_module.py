@@ -339,3 +339,23 @@ class TestModule:
         assert b1 is not b2
         assert isinstance(b1.a, A)
         assert isinstance(b2.a, C)
+
+    """
+    preserve_dependencies
+    """
+
+    def test_preserve_dependencies_with_success(self, module):
+        class A: ...
+
+        class B: ...
+
+        module.set_constant(A())
+
+        with module.preserve_dependencies():
+            module.set_constant(B())
+
+            assert A in module
+            assert B in module
+
+        assert A in module
+        assert B not in module
@@ -4,7 +4,7 @@ from typing import Annotated, Any, Optional, TypeVar, Union
 
 import pytest
 
-from injection import inject, injectable
+from injection import inject, injectable, mod
 
 T = TypeVar("T")
 
@@ -21,41 +21,47 @@ class SomeClass: ...
 
 
 class TestInject:
-    @classmethod
-    def assert_inject(cls, annotation: Any):
+    @pytest.mark.parametrize(
+        "annotation",
+        [
+            SomeInjectable,
+            Annotated[SomeInjectable, "metadata"],
+            Annotated[SomeInjectable, ["metadata"]],
+            Union[T, SomeInjectable],
+            T | SomeInjectable,
+            None | SomeInjectable,
+            Annotated[T | SomeInjectable, "metadata"],
+            Optional[SomeInjectable],
+        ],
+        ids=[
+            "class",
+            "annotated",
+            "annotated-unhashable",
+            "union",
+            "new-union",
+            "union-and-none",
+            "annotated-and-union",
+            "optional",
+        ],
+    )
+    def test_inject_with_success(self, annotation: Any):
         @inject
         def my_function(instance: annotation):
             assert isinstance(instance, SomeInjectable)
 
         my_function()
 
-    def test_inject_with_success(self):
-        self.assert_inject(SomeInjectable)
-
-    def test_inject_with_annotated(self):
-        self.assert_inject(Annotated[SomeInjectable, "metadata"])
-
-    def test_inject_with_union(self):
-        self.assert_inject(Union[T, SomeInjectable])
-
-    def test_inject_with_new_union(self):
-        self.assert_inject(T | SomeInjectable)
-
-    def test_inject_with_union_and_none(self):
-        self.assert_inject(None | SomeInjectable)
-
-    def test_inject_with_annotated_and_union(self):
-        self.assert_inject(Annotated[T | SomeInjectable, "metadata"])
-
-    def test_inject_with_optional(self):
-        self.assert_inject(Optional[SomeInjectable])
-
     def test_inject_with_no_parameter(self):
         @inject
         def my_function(): ...
 
         my_function()
 
+    def test_inject_with_no_parameter_return_original_function(self):
+        def my_function(): ...
+
+        assert inject(my_function) is my_function
+
     def test_inject_with_positional_only_parameter(self):
         @inject
         def my_function(instance: SomeInjectable, /, **kw):
@@ -120,6 +126,62 @@ class TestInject:
 
         await my_function()
 
+    async def test_inject_with_resolved_sync_dependency_chain_is_not_async(self):
+        class A: ...
+
+        class Unrelated: ...
+
+        @injectable
+        def a_recipe() -> A:
+            return A()
+
+        @injectable
+        class C:
+            def __init__(self, a: A):
+                self.a = a
+
+        @injectable
+        class B:
+            def __init__(self, a: A, c: C):
+                self.a = a
+                self.c = c
+
+        @inject
+        async def my_function(b: B):
+            assert isinstance(b, B)
+
+        await my_function()
+        assert mod()[B].is_async is False
+
+        mod().set_constant(Unrelated())
+        await my_function()
+
+    async def test_inject_with_async_dependency_registered_after_resolution(self):
+        class A: ...
+
+        @injectable
+        def a_recipe() -> A:
+            return A()
+
+        @injectable
+        class B:
+            def __init__(self, a: A):
+                self.a = a
+
+        @inject
+        async def my_function(b: B):
+            assert isinstance(b, B)
+
+        await my_function()
+        assert mod()[B].is_async is False
+
+        @injectable(on=A, mode="override")
+        async def async_a_recipe() -> A:
+            return A()
+
+        assert mod()[B].is_async is True
+        await my_function()
+
     def test_inject_with_generic_injectable(self):
         @inject
         def my_function(instance: SomeGenericInjectable[str]):